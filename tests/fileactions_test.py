@@ -3,6 +3,7 @@
 
 import os
 import shutil
+import sqlite3
 from unittest import main
 
 import vimiv.fileactions as fileactions
@@ -48,6 +49,18 @@ class FormatTest(VimivTestCase):
         fileactions.format_files(self.vimiv, "formatted_%Y_")
         self.assertIn("formatted_2016_001.jpg", os.listdir())
 
+    def test_format_files_with_exif_padding(self):
+        """Format files with zero-padded strftime directives."""
+        os.mkdir("testimages_to_format")
+        shutil.copyfile("testimages/arch_001.jpg",
+                        "testimages_to_format/arch_001.jpg")
+        self.run_command("./testimages_to_format/arch_001.jpg")
+        self.vimiv["library"].toggle()
+        fileactions.format_files(self.vimiv, "formatted_%Y_%m_")
+        files = [fil for fil in os.listdir() if "formatted_" in fil]
+        self.assertEqual(len(files), 1)
+        self.assertRegex(files[0], r"^formatted_2016_\d\d_001\.jpg$")
+
     def test_fail_format_files_with_exif(self):
         """Run format with exif on a file that has no exif data."""
         os.mkdir("testimages_to_format")
@@ -123,6 +136,97 @@ class FileActionsTest(VimivTestCase):
         self.assertTrue(fileactions.is_image("testimages/arch_001.jpg"))
         self.assertFalse(fileactions.is_image("testimages/not_an_image.jpg"))
 
+    def test_is_image_extension(self):
+        """Reject images with a foreign extension without reading them."""
+        os.mkdir("testimages_to_sniff")
+        for name in ["arch_001.txt", "arch_001"]:
+            shutil.copyfile("testimages/arch_001.jpg",
+                            os.path.join("testimages_to_sniff", name))
+        self.assertFalse(
+            fileactions.is_image("testimages_to_sniff/arch_001.txt"))
+        self.assertTrue(fileactions.is_image("testimages_to_sniff/arch_001"))
+
+    def test_edit_supported(self):
+        """Check whether file is editable."""
+        self.assertTrue(fileactions.edit_supported("testimages/arch_001.jpg"))
+        self.assertFalse(
+            fileactions.edit_supported("testimages/not_an_image.jpg"))
+
+    def test_populate_multiple_directories(self):
+        """Populate recursively from more than one directory."""
+        for directory in ["testimages_to_populate_a",
+                          "testimages_to_populate_b"]:
+            os.mkdir(directory)
+            shutil.copyfile("testimages/arch_001.jpg",
+                            os.path.join(directory, "arch_001.jpg"))
+        paths, index = fileactions.populate(
+            ["testimages_to_populate_a", "testimages_to_populate_b"],
+            recursive=True)
+        expected = [os.path.abspath("testimages_to_populate_a/arch_001.jpg"),
+                    os.path.abspath("testimages_to_populate_b/arch_001.jpg")]
+        self.assertEqual(sorted(paths), expected)
+        self.assertEqual(index, 0)
+
+    def test_populate_many_files(self):
+        """Keep the order of many files checked in parallel."""
+        os.mkdir("testimages_to_populate_a")
+        expected = []
+        args = []
+        for i in range(100):
+            name = "testimages_to_populate_a/%03d.jpg" % (i)
+            args.append(name)
+            # Mix images and files which only have an image extension
+            if i % 3:
+                shutil.copyfile("testimages/arch_001.jpg", name)
+                expected.append(os.path.abspath(name))
+            else:
+                shutil.copyfile("testimages/not_an_image.jpg", name)
+        args.reverse()
+        expected.reverse()
+        paths, _ = fileactions.populate(args, expand_single=False)
+        self.assertEqual(paths, expected)
+
+    def test_sniff_database(self):
+        """Store the image format of files on disk."""
+        os.mkdir("testimages_to_sniff")
+        shutil.copyfile("testimages/arch_001.jpg",
+                        "testimages_to_sniff/arch_001.jpg")
+        path = os.path.abspath("testimages_to_sniff/arch_001.jpg")
+        paths, _ = fileactions.populate([path])
+        self.assertEqual(paths, [path])
+        # The format of the file was stored
+        database = os.path.join(os.environ["XDG_CACHE_HOME"], "vimiv",
+                                "sniff.db")
+        connection = sqlite3.connect(database)
+        stat = os.stat(path)
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        query = "SELECT format FROM sniff WHERE dev=? AND ino=? AND " \
+            "mtime=? AND size=?"
+        self.assertEqual(connection.execute(query, key).fetchall(),
+                         [("jpeg",)])
+        # Stored formats are used instead of reading the file, as in a new
+        # session
+        shutil.copyfile("testimages/arch_001.jpg",
+                        "testimages_to_sniff/arch_002.jpg")
+        path = os.path.abspath("testimages_to_sniff/arch_002.jpg")
+        stat = os.stat(path)
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with connection:
+            connection.execute("INSERT INTO sniff VALUES (?, ?, ?, ?, 'svg')",
+                               key)
+        connection.close()
+        self.assertTrue(fileactions.is_svg(path))
+        # Changed files are read again
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertFalse(fileactions.is_svg(path))
+        self.assertTrue(fileactions.is_image(path))
+
+    def tearDown(self):
+        for directory in ["testimages_to_populate_a",
+                          "testimages_to_populate_b", "testimages_to_sniff"]:
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+
 
 if __name__ == "__main__":
     main()
@@ -4,6 +4,9 @@
 import os
 from unittest import main
 
+from gi import require_version
+require_version("GdkPixbuf", "2.0")
+from gi.repository import GdkPixbuf
 from vimiv_testcase import VimivTestCase, refresh_gui
 
 
@@ -97,6 +100,44 @@ class ImageTest(VimivTestCase):
         self.run_command("zoom_to value")
         self.check_statusbar("ERROR: Could not convert 'value' to float")
 
+    def test_downscaled_loading(self):
+        """Decode large images at the size they are shown."""
+        path = self.vimiv.get_path()
+        stat = os.stat(path)
+
+        def reload_image(delta):
+            """Load the image again, changing it so nothing is re-used."""
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta))
+            self.image.load()
+            for _ in range(100):
+                refresh_gui(0.01)
+                if self.image.is_downscaled():
+                    break
+        try:
+            # The image is more than twice as large as the window
+            reload_image(10**9)
+            self.assertTrue(self.image.is_downscaled())
+            window_width = self.vimiv["window"].get_size()[0]
+            self.assertAlmostEqual(self.image.get_zoom_percent_to_fit(),
+                                   window_width / 1920)
+            # Zooming in loads the full image in the background
+            self.image.zoom_to(0.5)
+            for _ in range(100):
+                refresh_gui(0.01)
+                if not self.image.is_downscaled():
+                    break
+            self.assertFalse(self.image.is_downscaled())
+            self.assertEqual(self.image.get_pixbuf().get_width(), 960)
+            # Editing receives the full image immediately
+            reload_image(2 * 10**9)
+            self.assertTrue(self.image.is_downscaled())
+            pixbuf = self.image.get_pixbuf_original()
+            self.assertEqual(pixbuf.get_width(), 1920)
+            self.assertFalse(self.image.is_downscaled())
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.image.zoom_to(0)
+
     def test_move(self):
         """Move from image to image."""
         self.assertEqual(1, self.vimiv.get_index())
@@ -154,6 +195,31 @@ class ImageTest(VimivTestCase):
         after = self.image.zoom_percent
         self.assertEqual(after, before)
 
+    def test_prefetch(self):
+        """Re-use prefetched neighbours unless the file changed."""
+        paths = self.vimiv.get_paths()
+        path = paths[(self.vimiv.get_index() + 1) % len(paths)]
+        # Wait for the neighbour to be loaded in the background
+        for _ in range(100):
+            refresh_gui(0.01)
+            if self.image.is_prefetched(path):
+                break
+        self.assertTrue(self.image.is_prefetched(path))
+        # Moving to the neighbour shows it immediately without loading
+        self.image.move_index()
+        width = GdkPixbuf.Pixbuf.get_file_info(path)[1]
+        self.assertEqual(self.image.get_pixbuf().get_width(),
+                         int(width * self.image.zoom_percent))
+        self.image.move_index(forward=False)
+        # Changed files are loaded again
+        stat = os.stat(path)
+        try:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertFalse(self.image.is_prefetched(path))
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertFalse(self.image.is_prefetched(path))
+
     def test_search(self):
         """Search in image mode."""
         self.run_search("arch")
@@ -2,10 +2,14 @@
 """Different actions applying directly to files."""
 
 import os
+import sqlite3
+from functools import lru_cache
+from multiprocessing.pool import ThreadPool as Pool
 from random import shuffle
+from threading import Lock
 
 from gi.repository import Gdk, GdkPixbuf, Gtk
-from vimiv.helpers import listdir_wrapper
+from vimiv.helpers import get_user_cache_dir, listdir_wrapper
 from vimiv.settings import settings
 
 # We need the try ... except wrapper here
@@ -16,6 +20,14 @@ try:
 except ImportError:
     _has_exif = False
 
+# All image formats GdkPixbuf can load by name and their file extensions
+_image_formats = {image_format.get_name(): image_format
+                  for image_format in GdkPixbuf.Pixbuf.get_formats()}
+# Tuple for str.endswith as some extensions have more parts, e.g. svg.gz
+_image_extensions = tuple(sorted({
+    "." + extension.lower() for image_format in _image_formats.values()
+    for extension in image_format.get_extensions()}))
+
 
 def recursive_search(directory):
     """Search a directory recursively for images.
@@ -23,21 +35,33 @@ def recursive_search(directory):
     Args:
         directory: Directory to search for images.
     Return:
-        List of images in directory.
+        Generator of all files in directory.
     """
-    for root, _, files in os.walk(directory):
-        for fil in files:
-            yield os.path.join(root, fil)
+    # os.scandir re-uses the file type information from reading the directory
+    # so no additional stat call is needed for each entry
+    directories = [directory]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        yield entry.path
+                    # Symbolic links to directories are not followed, just
+                    # like in os.walk
+                    elif not entry.is_symlink():
+                        directories.append(entry.path)
+        except OSError:  # Directory not readable, skip it like os.walk
+            continue
 
 
 def populate_single(arg, recursive):
     """Populate a complete filelist if only one path is given.
 
     Args:
-        arg: Single path given.
+        arg: Single absolute path given.
         recursive: If True search path recursively for images.
     Return:
-        Generated list of paths.
+        Generated list of absolute paths.
     """
     paths = []
     if os.path.isfile(arg):
@@ -65,24 +89,24 @@ def populate(args, recursive=False, shuffle_paths=False, expand_single=True):
     Return:
         Found paths, position of first given path.
     """
-    paths = []
     index = 0
     # If only one path is passed do special stuff
     first_path = os.path.abspath(args[0]) if args else None
     if len(args) == 1 and expand_single:
+        # Paths generated from an absolute path are already absolute
         args = populate_single(first_path, recursive)
+    else:
+        args = [os.path.abspath(arg) for arg in args]
 
-    # Add everything
-    for arg in args:
-        path = os.path.abspath(arg)
-        if os.path.isfile(path):
-            paths.append(path)
-        elif os.path.isdir(path) and recursive:
-            paths = list(recursive_search(path))
+    # Add everything keeping only files that may be images in memory
+    paths = [path for path in _iter_files(args, recursive)
+             if _has_image_extension(path)]
     # Remove unsupported files
-    paths = [possible_path for possible_path in paths
-             if is_image(possible_path)]
-    index = paths.index(first_path) if first_path in paths else 0
+    paths = _filter_images(paths)
+    _sniff_database.commit()
+    if first_path is not None:
+        positions = {path: i for i, path in enumerate(paths)}
+        index = positions.get(first_path, 0)
 
     # Shuffle
     if shuffle_paths:
@@ -91,27 +115,277 @@ def populate(args, recursive=False, shuffle_paths=False, expand_single=True):
     return paths, index
 
 
+def _iter_files(paths, recursive):
+    """Generate all files in paths.
+
+    Args:
+        paths: List of absolute paths to files and directories.
+        recursive: If True search directories recursively for files.
+    """
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+        elif os.path.isdir(path) and recursive:
+            yield from recursive_search(path)
+
+
+def _norm(filename):
+    """Receive the absolute path of a file expanding the user directory.
+
+    Args:
+        filename: Name of the file.
+    Return:
+        The absolute path of the file.
+    """
+    return os.path.abspath(os.path.expanduser(filename))
+
+
+def _filter_images(paths):
+    """Remove all paths that are not images.
+
+    Reading the file headers is I/O bound, so larger lists of paths are
+    checked in a thread pool.
+
+    Args:
+        paths: List of absolute paths with possible image extensions.
+    Return:
+        List of all images in paths keeping the order.
+    """
+    if len(paths) < 64:
+        return [path for path in paths if _is_image(path)]
+    with Pool(min(32, (os.cpu_count() or 1) * 4)) as pool:
+        supported = pool.map(_is_image, paths, chunksize=16)
+    return [path for path, image in zip(paths, supported) if image]
+
+
+class _SniffDatabase(object):
+    """Stores the image format of files on disk to re-use it across sessions.
+
+    Formats are collected in memory and written in one short transaction, so
+    the database is never locked while vimiv waits for the user. If another
+    instance is writing at the same time, the formats are simply not stored.
+    All rows are dropped once the available GdkPixbuf loaders change and
+    only the most recently stored rows are kept.
+
+    Attributes:
+        _connection: sqlite3.Connection to the database or None if it cannot
+            be used.
+        _filename: Path to the database file.
+        _lock: threading.Lock as files are checked in a thread pool.
+        _pending: List of rows which were not written yet.
+    """
+
+    _batch_size = 64
+    _max_rows = 100000
+
+    def __init__(self):
+        self._connection = None
+        self._filename = ""
+        self._lock = Lock()
+        self._pending = []
+
+    def get(self, key):
+        """Return the stored format name of a file.
+
+        Args:
+            key: Tuple of device, inode, mtime and size of the file.
+        Return:
+            Name of the image format, "" if the file is no image and None if
+            the file is not stored.
+        """
+        with self._lock:
+            if not self._connect():
+                return None
+            try:
+                row = self._connection.execute(
+                    "SELECT format FROM sniff WHERE dev=? AND ino=? AND "
+                    "mtime=? AND size=?", key).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def set(self, key, format_name):
+        """Store the format name of a file.
+
+        Args:
+            key: Tuple of device, inode, mtime and size of the file.
+            format_name: Name of the image format, "" if the file is no image.
+        """
+        with self._lock:
+            self._pending.append(key + (format_name,))
+            if len(self._pending) >= self._batch_size:
+                self._write()
+
+    def commit(self):
+        """Write all stored formats to disk."""
+        with self._lock:
+            self._write()
+
+    def _write(self):
+        """Write pending rows in one transaction, the lock must be held."""
+        rows, self._pending = self._pending, []
+        if not rows or not self._connect():
+            return
+        try:
+            with self._connection:  # Commits or rolls back immediately
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO sniff VALUES (?, ?, ?, ?, ?)",
+                    rows)
+        except sqlite3.Error:  # E.g. locked by another instance
+            pass
+
+    def _connect(self):
+        """Connect to the database in the current cache directory.
+
+        Return:
+            True if the database can be used.
+        """
+        filename = os.path.join(get_user_cache_dir(), "vimiv", "sniff.db")
+        if filename != self._filename:
+            self._filename = filename
+            self._close()
+            try:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                # Do not wait for other instances, the database is a cache
+                self._connection = sqlite3.connect(filename, timeout=0,
+                                                   check_same_thread=False)
+                # Readers and the writer do not block each other
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sniff (dev INT, ino INT, "
+                    "mtime INT, size INT, format TEXT, "
+                    "PRIMARY KEY (dev, ino, mtime, size))")
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS loaders (formats TEXT)")
+                self._connection.commit()
+            except (OSError, sqlite3.Error):
+                self._close()
+            # Formats stored with other loaders must not be used
+            if self._connection and not self._clean():
+                self._close()
+        return self._connection is not None
+
+    def _clean(self):
+        """Remove rows of other loaders and the oldest rows if there are many.
+
+        Files which are no image may become one with a new loader. As files
+        are stored again when they change, old rows are removed eventually.
+
+        Return:
+            True if the database was cleaned.
+        """
+        formats = ",".join(sorted(_image_formats))
+        try:
+            with self._connection:
+                row = self._connection.execute(
+                    "SELECT formats FROM loaders").fetchone()
+                if row is None or row[0] != formats:
+                    self._connection.execute("DELETE FROM sniff")
+                    self._connection.execute("DELETE FROM loaders")
+                    self._connection.execute(
+                        "INSERT INTO loaders VALUES (?)", (formats,))
+                # INSERT OR REPLACE gives every stored row a new rowid
+                self._connection.execute(
+                    "DELETE FROM sniff WHERE rowid <= "
+                    "(SELECT MAX(rowid) FROM sniff) - ?", (self._max_rows,))
+        except sqlite3.Error:  # E.g. locked by another instance
+            return False
+        return True
+
+    def _close(self):
+        """Close the connection to the database if there is one."""
+        if self._connection:
+            self._connection.close()
+        self._connection = None
+
+
+_sniff_database = _SniffDatabase()
+
+
+@lru_cache(maxsize=8192)
+def _file_info(filename, key):
+    """Cached wrapper around GdkPixbuf.Pixbuf.get_file_info.
+
+    The format is also stored on disk, so files are only read if they were
+    not checked in an earlier session.
+
+    Args:
+        filename: Absolute path to the file to check.
+        key: Tuple of device, inode, mtime and size of the file.
+            Invalidates the cached information if the file changes.
+    Return:
+        GdkPixbuf.PixbufFormat of the file or None if it is no image.
+    """
+    format_name = _sniff_database.get(key)
+    if format_name is not None:
+        return _image_formats.get(format_name)
+    info = GdkPixbuf.Pixbuf.get_file_info(filename)[0]
+    _sniff_database.set(key, info.get_name() if info else "")
+    return info
+
+
+def _sniff(complete_name):
+    """Receive the image format of a file reading its header at most once.
+
+    Args:
+        complete_name: Absolute path to the file to check.
+    Return:
+        GdkPixbuf.PixbufFormat of the file or None if it is no image.
+    """
+    try:
+        stat = os.stat(complete_name)
+    except OSError:
+        return None
+    key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return _file_info(complete_name, key)
+
+
 def is_image(filename):
     """Check whether a file is an image.
 
     Args:
         filename: Name of file to check.
     """
+    complete_name = _norm(filename)
+    return _has_image_extension(complete_name) and _is_image(complete_name)
+
+
+def _is_image(complete_name):
+    """Check whether a file is an image reading its header if necessary.
+
+    The path is neither normalized nor is its extension checked.
+
+    Args:
+        complete_name: Absolute path to the file to check.
+    """
     try:
-        complete_name = os.path.abspath(os.path.expanduser(filename))
-        return bool(GdkPixbuf.Pixbuf.get_file_info(complete_name)[0])
+        return bool(_sniff(complete_name))
     except UnicodeEncodeError:
         return False
 
 
+def _has_image_extension(filename):
+    """Check whether a file may be an image according to its extension.
+
+    Files with an extension GdkPixbuf cannot load are rejected without opening
+    them, files without extension may be images.
+
+    Args:
+        filename: Name of file to check.
+    """
+    if not os.path.splitext(filename)[1]:
+        return True
+    return filename.lower().endswith(_image_extensions)
+
+
 def is_animation(filename):
     """Check whether a file is an animated image.
 
     Args:
         filename: Name of file to check.
     """
-    complete_name = os.path.abspath(os.path.expanduser(filename))
-    info = GdkPixbuf.Pixbuf.get_file_info(complete_name)[0]
+    complete_name = _norm(filename)
+    info = _sniff(complete_name)
     if not info:
         return False
     return "gif" in info.get_extensions()
@@ -123,8 +397,8 @@ def is_svg(filename):
     Args:
         filename: Name of file to check.
     """
-    complete_name = os.path.abspath(os.path.expanduser(filename))
-    info = GdkPixbuf.Pixbuf.get_file_info(complete_name)[0]
+    complete_name = _norm(filename)
+    info = _sniff(complete_name)
     return "svg" in info.get_extensions() if info else False
 
 
@@ -134,19 +408,40 @@ def edit_supported(filename):
     Args:
         filename: Name of file to check.
     """
-    complete_name = os.path.abspath(os.path.expanduser(filename))
-    info = GdkPixbuf.Pixbuf.get_file_info(complete_name)[0]
-    extension = info.get_extensions()[0]
-    if extension in ["jpeg", "png", "tiff", "ico", "bmp"]:
-        return True
-    return False
+    complete_name = _norm(filename)
+    info = _sniff(complete_name)
+    if not info:
+        return False
+    return info.get_name() in ["jpeg", "png", "tiff", "ico", "bmp"]
+
+
+def _get_exif_dates(paths):
+    """Receive the date at which the images in paths were taken.
+
+    Reading stops at the first image without exif date, so the list is only
+    as long as paths if all images have one.
+
+    Args:
+        paths: List of images to read the date from.
+    Return:
+        List of datetime objects ending with None if an image has no exif
+        date.
+    """
+    dates = []
+    for fil in paths:
+        try:
+            dates.append(GExiv2.Metadata(fil).get_date_time())
+        except KeyError:
+            dates.append(None)
+            break  # No need to read the remaining files
+    return dates
 
 
 def format_files(app, string):
     """Format image names in filelist according to a formatstring.
 
     Numbers files in form of formatstring_000.extension. Replaces exif
-    information accordingly.
+    information accordingly using the directives of strftime, e.g. %Y.
 
     Args:
         app: Vimiv application to interact with.
@@ -161,6 +456,7 @@ def format_files(app, string):
         app["statusbar"].message("No files in path", "info")
         return
 
+    paths = app.get_paths()
     # Check if exif data is available and needed
     tofind = ("%" in string)
     if tofind:
@@ -168,28 +464,21 @@ def format_files(app, string):
             app["statusbar"].message(
                 "Install gexiv2 for EXIF support in vimiv", "error")
             return
-        for fil in app.get_paths():
-            exif = GExiv2.Metadata(fil)
-            try:
-                exif.get_date_time()
-            except KeyError:
+        dates = _get_exif_dates(paths)
+        for fil, date in zip(paths, dates):
+            if date is None:
                 app["statusbar"].message(
                     "No exif data for %s available" % (fil), "error")
                 return
+    else:
+        dates = [None] * len(paths)
 
-    for i, fil in enumerate(app.get_paths()):
+    for i, (fil, date) in enumerate(zip(paths, dates)):
         ending = os.path.splitext(fil)[1]
         num = "%03d" % (i + 1)
         # Exif stuff
         if tofind:
-            exif = GExiv2.Metadata(fil)
-            date = exif.get_date_time()
-            outstring = string.replace("%Y", str(date.year))
-            outstring = outstring.replace("%m", str(date.month))
-            outstring = outstring.replace("%d", str(date.day))
-            outstring = outstring.replace("%H", str(date.hour))
-            outstring = outstring.replace("%M", str(date.minute))
-            outstring = outstring.replace("%S", str(date.second))
+            outstring = date.strftime(string)
         else:
             outstring = string
         # Ending
@@ -200,7 +489,13 @@ def format_files(app, string):
 
 
 class ClipboardHandler(object):
-    """Deals with copying to the system clipboard."""
+    """Deals with copying to the system clipboard.
+
+    Attributes:
+        _app: The main vimiv class to interact with.
+        _clipboard: Gtk.Clipboard of the clipboard selection.
+        _primary: Gtk.Clipboard of the primary selection.
+    """
 
     def __init__(self, app):
         """Receive and set main vimiv application.
@@ -209,6 +504,8 @@ class ClipboardHandler(object):
             _app: The main vimiv class to interact with.
         """
         self._app = app
+        self._clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+        self._primary = Gtk.Clipboard.get(Gdk.SELECTION_PRIMARY)
 
     def copy_name(self, abspath=False):
         """Copy image name to clipboard.
@@ -223,13 +520,11 @@ class ClipboardHandler(object):
         else:
             name = os.path.basename(name)
         # Set clipboard
-        clipboard = Gtk.Clipboard.get(Gdk.SELECTION_PRIMARY) \
-            if settings["copy_to_primary"].get_value() \
-            else Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+        to_primary = settings["copy_to_primary"].get_value()
+        clipboard = self._primary if to_primary else self._clipboard
         # Text to clipboard
         clipboard.set_text(name, -1)
         # Info message
         message = "Copied <b>" + name + "</b> to %s" % \
-            ("primary" if settings["copy_to_primary"].get_value()
-             else "clipboard")
+            ("primary" if to_primary else "clipboard")
         self._app["statusbar"].message(message, "info")
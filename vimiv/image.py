@@ -1,6 +1,9 @@
 # vim: ft=python fileencoding=utf-8 sw=4 et sts=4
 """Image part of vimiv."""
 
+import os
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool as Pool
 from random import shuffle
 from threading import Thread
 
@@ -11,6 +14,51 @@ from vimiv.helpers import get_float
 from vimiv.settings import settings
 
 
+def _get_file_key(path):
+    """Receive modification time and size of a file to detect changes.
+
+    Args:
+        path: Path to the file.
+    Return:
+        Tuple of modification time and size or None if the file is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_zoom_to_fit(image_size, available_size, fit):
+    """Get the zoom factor fitting an image of image_size into available_size.
+
+    Args:
+        image_size: Size of the image as a tuple.
+        available_size: Size available for the image as a tuple.
+        fit: How to fit image.
+    Return:
+        Zoom percentage.
+    """
+    pbo_width, pbo_height = image_size
+    # Maximum size respecting overzoom
+    max_width = pbo_width * settings["overzoom"].get_value()
+    max_height = pbo_height * settings["overzoom"].get_value()
+    # Get scales for "panorama" vs "portrait" image
+    w_scale = pbo_width / available_size[0]
+    h_scale = pbo_height / available_size[1]
+    scale_width = True if w_scale > h_scale else False
+    # Check if image fits completely with overzoom
+    fits = max_width < available_size[0] and max_height < available_size[1]
+    # Image fits completely even with overzoom and we do not want to fit
+    if fits and fit in ["user", "overzoom"]:
+        return settings["overzoom"].get_value()
+    # Force horizontal fit or "panorama" image
+    elif fit == "horizontal" or (scale_width and fit != "vertical"):
+        return available_size[0] / pbo_width
+    # Force vertical fit or "portrait" image
+    return available_size[1] / pbo_height
+
+
 class Image(Gtk.Image):
     """Image class for vimiv.
 
@@ -29,11 +77,33 @@ class Image(Gtk.Image):
         _identifier: Used so GUI callbacks are only done if the image is equal
         _pixbuf_iter: Iter of displayed animation.
         _pixbuf_original: Original image.
+        _full_size: Size of the image file if _pixbuf_original was decoded
+            downscaled to fit the window, None otherwise.
+        _last_scale: Tuple of the last scaled original image, its width, its
+            height and the scaled image so it can be re-used.
+        _fit_scale: Same as _last_scale for the image zoomed to fit.
+        _zoom_timer_id: Id of the timer that rescales large images smoothly
+            once zooming stopped.
+        _update_id: Id of the timer of a delayed update.
         _size: Size of the displayed image as a tuple.
         _timer_id: Id of current animation timer.
         _faulty_image: Necessary evil for images that PixbufLoader cannot read.
+        _is_svg: True if the loaded image is a vector graphic.
+        _full_load_id: Identifier of the image that is loaded in full
+            resolution in the background.
+        _prefetched: OrderedDict of recently loaded images to re-use.
+            _prefetched[path] = (file key, GdkPixbuf.Pixbuf, full size)
+            where full size is the size of the file if the pixbuf was
+            decoded downscaled, None otherwise.
+        _prefetching: Set of paths which are currently being prefetched.
+        _prefetch_pool: ThreadPool to load neighbouring images in.
     """
 
+    _prefetch_size = 4
+    # Load the full image once the downscaled one is shown larger, showing
+    # and hiding the statusbar does not change the size this much
+    _full_load_margin = 1.1
+
     def __init__(self, app):
         """Set default values for attributes."""
         super(Image, self).__init__()
@@ -43,38 +113,118 @@ class Image(Gtk.Image):
         self.fit_image = "overzoom"
         self._pixbuf_iter = GdkPixbuf.PixbufAnimationIter()
         self._pixbuf_original = GdkPixbuf.Pixbuf()
+        self._full_size = None
+        self._last_scale = (None, 0, 0, None)
+        self._fit_scale = (None, 0, 0, None)
+        self._zoom_timer_id = 0
+        self._update_id = 0
         self.zoom_percent = 1
         self._identifier = 0
         self._size = (1, 1)
         self._timer_id = 0
         self._faulty_image = False
+        self._is_svg = False
+        self._full_load_id = 0
+        self._prefetched = OrderedDict()
+        self._prefetching = set()
+        self._prefetch_pool = Pool(1)
 
         # Connect signals
+        self._app.connect("shutdown", self._on_shutdown)
         self._app["transform"].connect("changed", self._on_image_changed)
         self._app["commandline"].search.connect("search-completed",
                                                 self._on_search_completed)
         settings.connect("changed", self._on_settings_changed)
 
-    def _update(self):
-        """Show the final image."""
+    def _update(self, delayed=False):
+        """Show the final image.
+
+        Args:
+            delayed: If True, combine all updates requested within one frame
+                so the image is only scaled once, e.g. when resizing.
+        """
+        if delayed:
+            if not self._update_id:
+                self._update_id = GLib.timeout_add(16, self._on_delayed_update)
+            return
+        # A pending delayed update is done now
+        if self._update_id:
+            GLib.source_remove(self._update_id)
+            self._update_id = 0
         if not self._app.get_paths() or self._faulty_image:
             return
         # Scale image
-        pbo_width = self._pixbuf_original.get_width()
-        pbo_height = self._pixbuf_original.get_height()
+        pbo_width, pbo_height = self._get_original_size()
         pbf_width = int(pbo_width * self.zoom_percent)
         pbf_height = int(pbo_height * self.zoom_percent)
+        # The downscaled image is not large enough anymore, it is shown
+        # until the full image is loaded
+        if self._full_size and pbf_width > \
+                self._pixbuf_original.get_width() * self._full_load_margin:
+            self._load_full_in_background()
         # Rescaling of svg
-        if is_svg(self._app.get_path()) and settings["rescale_svg"].get_value():
+        if self._is_svg and settings["rescale_svg"].get_value():
             pixbuf_final = GdkPixbuf.Pixbuf.new_from_file_at_scale(
                 self._app.get_path(), -1, pbf_height, True)
+        # Large images are scaled quickly until zooming stopped
+        elif self._zoom_timer_id:
+            pixbuf_final = self._scale_pixbuf(pbf_width, pbf_height,
+                                              GdkPixbuf.InterpType.NEAREST)
         else:
-            pixbuf_final = self._pixbuf_original.scale_simple(
-                pbf_width, pbf_height, GdkPixbuf.InterpType.BILINEAR)
+            pixbuf_final = self._scale_pixbuf(pbf_width, pbf_height)
         self.set_from_pixbuf(pixbuf_final)
         # Update the statusbar
         self._app["statusbar"].update_info()
 
+    def _scale_pixbuf(self, width, height,
+                      interp=GdkPixbuf.InterpType.BILINEAR):
+        """Scale the original image re-using earlier results if possible.
+
+        The last scaled image and the image zoomed to fit are kept.
+
+        Args:
+            width: Width of the scaled image.
+            height: Height of the scaled image.
+            interp: GdkPixbuf.InterpType used for scaling. Only images scaled
+                using BILINEAR are kept for re-use.
+        Return:
+            The scaled GdkPixbuf.Pixbuf.
+        """
+        key = (self._pixbuf_original, width, height)
+        for cached in [self._last_scale, self._fit_scale]:
+            if cached[0] is key[0] and cached[1:3] == key[1:]:
+                return cached[3]
+        scaled = self._pixbuf_original.scale_simple(width, height, interp)
+        if interp == GdkPixbuf.InterpType.BILINEAR:
+            self._last_scale = key + (scaled,)
+            if self.fit_image != "user":
+                self._fit_scale = self._last_scale
+        return scaled
+
+    def _clear_scale_cache(self):
+        """Remove all scaled images kept for re-use."""
+        self._last_scale = (None, 0, 0, None)
+        self._fit_scale = (None, 0, 0, None)
+
+    def _start_zoom_timer(self):
+        """Scale large images quickly and smoothly once zooming stopped."""
+        width, height = self._get_original_size()
+        if width * height < 20e6:
+            return
+        if self._zoom_timer_id:
+            GLib.source_remove(self._zoom_timer_id)
+        self._zoom_timer_id = GLib.timeout_add(250, self._on_zoom_stopped)
+
+    def _on_delayed_update(self):
+        self._update_id = 0
+        self._update()
+        return False  # Only run once
+
+    def _on_zoom_stopped(self):
+        self._zoom_timer_id = 0
+        self._update()
+        return False  # Only run once
+
     def zoom_delta(self, zoom_in=True, step=1):
         """Zoom the image by delta percent.
 
@@ -95,15 +245,18 @@ class Image(Gtk.Image):
             self.zoom_percent = self.zoom_percent * (1 + delta * step)
         else:
             self.zoom_percent = self.zoom_percent / (1 + delta * step)
-        self._catch_unreasonable_zoom_and_update(fallback_zoom)
+        self._start_zoom_timer()
+        self._catch_unreasonable_zoom_and_update(fallback_zoom, delayed=True)
         self.fit_image = "user"
 
-    def zoom_to(self, percent=0, fit="fit"):
+    def zoom_to(self, percent=0, fit="fit", delayed=False):
         """Zoom to a given percentage.
 
         Args:
             percent: Percentage to zoom to.
             fit: How to fit image if percent is not given.
+            delayed: If True, delay the update of the image to combine it with
+                other updates.
         """
         fallback_zoom = self.zoom_percent
         # Catch user zooms
@@ -124,7 +277,7 @@ class Image(Gtk.Image):
             self.zoom_percent = self.get_zoom_percent_to_fit(fit)
             self.fit_image = fit
         # Catch some unreasonable zooms
-        self._catch_unreasonable_zoom_and_update(fallback_zoom)
+        self._catch_unreasonable_zoom_and_update(fallback_zoom, delayed)
 
     def move_index(self, forward=True, key=None, delta=1, force=False):
         """Move by delta in paths.
@@ -151,7 +304,7 @@ class Image(Gtk.Image):
 
         # Reshuffle on wrap-around
         if settings["shuffle"].get_value() \
-                and self._app.get_index() is 0 and delta > 0:
+                and self._app.get_index() == 0 and delta > 0:
             shuffle(self._app.get_paths())
 
         # Load the image at path into self._pixbuf_* and show it
@@ -213,44 +366,113 @@ class Image(Gtk.Image):
         Return:
             Zoom percentage.
         """
-        # Size of the file
-        pbo_width = self._pixbuf_original.get_width()
-        pbo_height = self._pixbuf_original.get_height()
-        # Maximum size respecting overzoom
-        max_width = pbo_width * settings["overzoom"].get_value()
-        max_height = pbo_height * settings["overzoom"].get_value()
-        # Get scales for "panorama" vs "portrait" image
-        w_scale = pbo_width / self._size[0]
-        h_scale = pbo_height / self._size[1]
-        scale_width = True if w_scale > h_scale else False
-        # Check if image fits completely with overzoom
-        fits = max_width < self._size[0] and max_height < self._size[1]
-        # Image fits completely even with overzoom and we do not want to fit
-        if fits and fit in ["user", "overzoom"]:
-            return settings["overzoom"].get_value()
-        # Force horizontal fit or "panorama" image
-        elif fit == "horizontal" or (scale_width and fit != "vertical"):
-            return self._size[0] / pbo_width
-        # Force vertical fit or "portrait" image
-        return self._size[1] / pbo_height
-
-    def _catch_unreasonable_zoom_and_update(self, fallback_zoom):
+        return _get_zoom_to_fit(self._get_original_size(), self._size, fit)
+
+    def _get_original_size(self):
+        """Return the size of the original image as a tuple."""
+        if self._full_size:
+            return self._full_size
+        return (self._pixbuf_original.get_width(),
+                self._pixbuf_original.get_height())
+
+    def load_full(self):
+        """Replace a downscaled image by the image in full resolution.
+
+        The image is loaded immediately as editing and transformations need
+        all pixels.
+
+        Return:
+            True if the image is available in full resolution.
+        """
+        if not self._full_size:
+            return True
+        path = self._app.get_path()
+        pixbuf, full_size = self._get_prefetched(path) or (None, None)
+        if not pixbuf or full_size:
+            key = _get_file_key(path)
+            try:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+            except GLib.GError:
+                return False
+            self._add_prefetched(path, key, pixbuf)
+        self._pixbuf_original = pixbuf
+        self._full_size = None
+        self._clear_scale_cache()
+        return True
+
+    def is_downscaled(self):
+        """Return True if the image was decoded smaller than the file."""
+        return self._full_size is not None
+
+    def _load_full_in_background(self):
+        """Load the image in full resolution in a thread.
+
+        The downscaled image is shown until loading finished.
+        """
+        if self._full_load_id == self._identifier:
+            return
+        self._full_load_id = self._identifier
+        path = self._app.get_path()
+        pixbuf, full_size = self._get_prefetched(path) or (None, None)
+        if pixbuf and not full_size:
+            self.load_full()
+            return
+        load_thread = Thread(target=self._load_full_thread,
+                             args=(path, self._identifier), daemon=True)
+        load_thread.start()
+
+    def _load_full_thread(self, path, image_id):
+        key = _get_file_key(path)
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+        except GLib.GError as e:
+            GLib.idle_add(self._on_full_load_failed, str(e), image_id)
+            return
+        GLib.idle_add(self._set_full_pixbuf, path, key, pixbuf, image_id)
+
+    def _set_full_pixbuf(self, path, key, pixbuf, image_id):
+        """Replace the downscaled image by the full one loaded in the thread.
+
+        Args:
+            path: Path to the loaded image.
+            key: File key of the image before it was loaded.
+            pixbuf: The loaded GdkPixbuf.Pixbuf.
+            image_id: Identifier of the image the full load was started for.
+        """
+        self._add_prefetched(path, key, pixbuf)
+        # Drop the image if the user moved on or it was edited meanwhile
+        if self._identifier == image_id and self._full_size:
+            if self.load_full():
+                self._update()
+            else:  # The file changed and cannot be read anymore
+                self._on_full_load_failed(
+                    "Image could not be loaded in full resolution", image_id)
+        return False  # Only run once
+
+    def _on_full_load_failed(self, message, image_id):
+        # Keep showing the downscaled image
+        if self._identifier == image_id:
+            self._app["statusbar"].message(message, "error")
+        return False  # Only run once
+
+    def _catch_unreasonable_zoom_and_update(self, fallback_zoom,
+                                            delayed=False):
         """Catch unreasonable zooms otherwise update.
 
         Args:
             fallback_zoom: Zoom percentage to fall back to if the zoom
                 percentage is unreasonable.
+            delayed: If True, delay the update of the image.
         """
-        orig_width = self._pixbuf_original.get_width()
-        orig_height = self._pixbuf_original.get_height()
+        orig_width, orig_height = self._get_original_size()
         new_width = orig_width * self.zoom_percent
         new_height = orig_height * self.zoom_percent
         min_width = max(16, orig_width * 0.05)
         min_height = max(16, orig_height * 0.05)
         max_width = min(self._app["window"].get_size()[0] * 10,
-                        self._pixbuf_original.get_width() * 20)
+                        orig_width * 20)
         max_height = min(self._app["window"].get_size()[1] * 10,
-                         self._pixbuf_original.get_height() * 20)
+                         orig_height * 20)
         # Image too small or too large
         if new_height < min_height or new_width < min_width \
                 or new_height > max_height or new_width > max_width:
@@ -260,11 +482,14 @@ class Image(Gtk.Image):
                 self._app["statusbar"].message(message, "warning")
                 self.zoom_percent = fallback_zoom
             return
-        self._update()
+        self._update(delayed)
 
     def _play_gif(self):
         """Run the animation of a gif."""
         self._pixbuf_original = self._pixbuf_iter.get_pixbuf()
+        self._full_size = None
+        # The animation may re-use the pixbuf for the next frame
+        self._clear_scale_cache()
         GLib.idle_add(self._update)
         if self._pixbuf_iter.advance():
             # Clear old timer
@@ -305,19 +530,41 @@ class Image(Gtk.Image):
         """Actual implementation to load an image from path."""
         loader = GdkPixbuf.PixbufLoader()
         self._identifier += 1
+        self._clear_scale_cache()
+        if self._zoom_timer_id:
+            GLib.source_remove(self._zoom_timer_id)
+            self._zoom_timer_id = 0
+        self._is_svg = is_svg(path)
+        prefetched = self._get_prefetched(path)
+        if prefetched:
+            self._faulty_image = False
+            self._pixbuf_original, self._full_size = prefetched
+            self._set_image_pixbuf()
+            self._update()
+            self._prefetch_neighbours()
+            return
         if is_animation(path):
-            loader.connect("area-prepared", self._set_image_anim)
+            loader.connect("area-prepared", self._on_area_prepared,
+                           self._set_image_anim, self._identifier)
         else:
-            loader.connect("area-prepared", self._set_image_pixbuf)
-            loader.connect("closed",
-                           self._finish_image_pixbuf, self._identifier)
-        load_thread = Thread(target=self._load_thread, args=(loader, path),
+            # Filled with the size of the file if it is decoded downscaled
+            full_size = []
+            loader.connect("size-prepared", self._on_size_prepared,
+                           self._get_available_size(), self.fit_image,
+                           full_size)
+            loader.connect("area-prepared", self._on_area_prepared,
+                           self._set_image_pixbuf, self._identifier,
+                           full_size)
+            loader.connect("closed", self._finish_image_pixbuf, path,
+                           self._identifier)
+        load_thread = Thread(target=self._load_thread,
+                             args=(loader, path, self._identifier),
                              daemon=True)
         # Daemon is set to True so the program can exit with "q" immediately if
         # only a loading thread is left
         load_thread.start()
 
-    def _load_thread(self, loader, path):
+    def _load_thread(self, loader, path, image_id):
         # The try ... except wrapper and the _faulty_image attribute are used to
         # catch weird images that break GdkPixbufLoader but work otherwise
         # See https://github.com/karlch/vimiv/issues/49 for more information
@@ -329,10 +576,44 @@ class Image(Gtk.Image):
             self._faulty_image = False
             loader.close()
         except GLib.GError:
-            self._pixbuf_original = GdkPixbuf.Pixbuf.new_from_file(path)
-            self._faulty_image = False
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+            GLib.idle_add(self._set_faulty_image, pixbuf, image_id)
+
+    def _on_size_prepared(self, loader, width, height, available_size, fit,
+                          full_size):
+        """Decode large jpeg images directly at the size fitting the window.
+
+        libjpeg can decode at 1/2, 1/4 or 1/8 of the size which is a lot
+        faster and needs less memory than decoding the full image. The full
+        image is loaded once it is zoomed in further.
+        """
+        if loader.get_format().get_name() != "jpeg":
+            return
+        zoom = _get_zoom_to_fit((width, height), available_size, fit)
+        if zoom <= 0.5:
+            loader.set_size(max(1, int(width * zoom)),
+                            max(1, int(height * zoom)))
+            full_size.append((width, height))
+
+    def _on_area_prepared(self, loader, set_image, image_id, full_size=None):
+        # Emitted in the loading thread, the image is set in the main loop
+        GLib.idle_add(self._set_image, loader, set_image, image_id, full_size)
+
+    def _set_image(self, loader, set_image, image_id, full_size):
+        # Drop images of old loads if the user moved on in the meantime
+        if self._identifier == image_id:
+            self._full_size = full_size[0] if full_size else None
+            set_image(loader)
+        return False  # Only run once
+
+    def _set_faulty_image(self, pixbuf, image_id):
+        self._faulty_image = False
+        if self._identifier == image_id:
+            self._pixbuf_original = pixbuf
+            self._full_size = None
             self._set_image_pixbuf()
-            GLib.idle_add(self._update)
+            self._update()
+        return False  # Only run once
 
     def _set_image_pixbuf(self, loader=None):
         if loader:
@@ -340,9 +621,96 @@ class Image(Gtk.Image):
         self._size = self._get_available_size()
         self.zoom_percent = self.get_zoom_percent_to_fit(self.fit_image)
 
-    def _finish_image_pixbuf(self, loader, image_id):
+    def _finish_image_pixbuf(self, loader, path, image_id):
+        # Emitted in the loading thread, finish in the main loop
+        GLib.idle_add(self._on_image_finished, loader, path, image_id)
+
+    def _on_image_finished(self, loader, path, image_id):
         if self._identifier == image_id:
-            GLib.idle_add(self._update)
+            # The pixbuf of the loader was filled or scaled while loading,
+            # a downscaled one may already be replaced by the full image
+            if self._full_size and loader.get_pixbuf():
+                self._pixbuf_original = loader.get_pixbuf()
+            self._clear_scale_cache()
+            self._update()
+            self._add_prefetched(path, _get_file_key(path),
+                                 self._pixbuf_original, self._full_size)
+            self._prefetch_neighbours()
+        return False  # Only run once
+
+    def _get_prefetched(self, path):
+        """Return the prefetched image of path if the file did not change.
+
+        Return:
+            Tuple of the GdkPixbuf.Pixbuf and the size of the file if the
+            pixbuf was decoded downscaled, None if nothing is prefetched.
+        """
+        if path not in self._prefetched:
+            return None
+        key, pixbuf, full_size = self._prefetched[path]
+        if key is None or key != _get_file_key(path):
+            del self._prefetched[path]
+            return None
+        self._prefetched.move_to_end(path)
+        return pixbuf, full_size
+
+    def _add_prefetched(self, path, key, pixbuf, full_size=None):
+        """Keep a loaded pixbuf removing the least recently used ones."""
+        self._prefetching.discard(path)
+        self._prefetched[path] = (key, pixbuf, full_size)
+        self._prefetched.move_to_end(path)
+        while len(self._prefetched) > self._prefetch_size:
+            self._prefetched.popitem(last=False)
+        return False  # Only run once when called via GLib.idle_add
+
+    def _prefetch_neighbours(self):
+        """Load the previous and next image in the background."""
+        paths = self._app.get_paths()
+        if not paths:
+            return
+        index = self._app.get_index()
+        # Neighbours are zoomed to fit once they are shown
+        available_size = self._get_available_size()
+        for neighbour in [index + 1, index - 1]:
+            path = paths[neighbour % len(paths)]
+            if path in self._prefetched or path in self._prefetching \
+                    or is_animation(path):
+                continue
+            self._prefetching.add(path)
+            self._prefetch_pool.apply_async(self._prefetch_thread,
+                                            (path, available_size))
+
+    def _prefetch_thread(self, path, available_size):
+        key = _get_file_key(path)
+        # Large jpeg images are decoded downscaled just like in _load
+        loader = GdkPixbuf.PixbufLoader()
+        full_size = []
+        loader.connect("size-prepared", self._on_size_prepared,
+                       available_size, "overzoom", full_size)
+        try:
+            with open(path, "rb") as f:
+                loader.write(f.read())
+            loader.close()
+            GLib.idle_add(self._add_prefetched, path, key,
+                          loader.get_pixbuf(),
+                          full_size[0] if full_size else None)
+        except (GLib.GError, OSError):
+            pass
+        finally:
+            # Allow prefetching the image again whatever happened
+            GLib.idle_add(self._prefetching.discard, path)
+
+    def is_prefetched(self, path):
+        """Return True if the image at path was prefetched and did not change.
+
+        Args:
+            path: Path to the image.
+        """
+        return self._get_prefetched(path) is not None
+
+    def _on_shutdown(self, app):
+        # Do not wait for neighbours which are still loading
+        self._prefetch_pool.terminate()
 
     def _set_image_anim(self, loader):
         self._pixbuf_iter = loader.get_animation().get_iter()
@@ -355,10 +723,19 @@ class Image(Gtk.Image):
                 if delay >= 0 else 0
 
     def get_pixbuf_original(self):
+        """Return a copy of the original image in full resolution.
+
+        Return:
+            The GdkPixbuf.Pixbuf or None if the image could not be loaded in
+            full resolution.
+        """
+        if not self.load_full():
+            return None
         return self._pixbuf_original.copy()
 
     def set_pixbuf(self, pixbuf):
         self._pixbuf_original = pixbuf
+        self._full_size = None
         self._update()
 
     def _on_image_changed(self, transform, change, arg):
@@ -369,6 +746,12 @@ class Image(Gtk.Image):
             change: The type of transformation.
             arg: Argument for the transformation, e.g. cwise for rotate.
         """
+        # Transform checks that the full image can be loaded beforehand,
+        # transforming the downscaled image would distort it
+        if not self.load_full():
+            return
+        # The file is changed once the transformation is applied
+        self._prefetched.pop(self._app.get_path(), None)
         if change == "rotate":
             self._pixbuf_original = \
                 self._pixbuf_original.rotate_simple(90 * arg)
@@ -406,9 +406,9 @@ class Library(Gtk.TreeView):
             decremented_index = max(0, self.get_position() - 1)
             filename = self.files[self.get_position()]
             self.reload(os.getcwd())
-            if filename in self.files:
+            try:
                 index = self.files.index(filename)
-            else:
+            except ValueError:
                 index = min(decremented_index, len(self.files) - 1)
             self.move_pos(defined_pos=index)
 
@@ -455,8 +455,10 @@ class Library(Gtk.TreeView):
         """
         if directory in self._positions:
             filename = self._positions[directory]
-            if filename in self.files:
+            try:
                 return self.files.index(filename)
+            except ValueError:
+                pass
         return 0
 
     def __setitem__(self, directory, filename):
@@ -119,7 +119,8 @@ class MainWindow(Gtk.ScrolledWindow):
         if self.thumbnail.toggled:
             self.thumbnail.calculate_columns()
         elif self._app.get_paths() and self.image.fit_image != "user":
-            self.image.zoom_to(0, self.image.fit_image)
+            # The layout changes many times in a row when resizing the window
+            self.image.zoom_to(0, self.image.fit_image, delayed=True)
 
     def _on_paths_changed(self, app, transform):
         """Reload paths image and/or thumbnail when paths have changed."""
@@ -135,10 +136,10 @@ class MainWindow(Gtk.ScrolledWindow):
             if self.thumbnail.toggled:
                 self.thumbnail.on_paths_changed()
             # Refocus the path
-            if focused_path in self._app.get_paths():
+            try:
                 index = self._app.get_paths().index(focused_path)
             # Stay as close as possible
-            else:
+            except ValueError:
                 index = min(decremented_index, len(self._app.get_paths()) - 1)
             if self.thumbnail.toggled:
                 self.thumbnail.move_to_pos(index)
@@ -121,6 +121,10 @@ class Manipulate(Gtk.ScrolledWindow):
             elif not edit_supported(self._app.get_path()):
                 self._app["statusbar"].message(
                     "This filetype is not supported", "warning")
+            # Never edit and save a downscaled image
+            elif not self._app["image"].load_full():
+                self._app["statusbar"].message(
+                    "Image could not be loaded in full resolution", "error")
             else:
                 self.show()
                 self._pixbuf = self._app["image"].get_pixbuf_original()
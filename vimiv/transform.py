@@ -175,6 +175,10 @@ class Transform(GObject.Object):
             raise NotTransformable("No image to")
         elif not edit_supported(self._app.get_path()):
             raise NotTransformable("Filetype not supported for")
+        # The shown image is transformed in full resolution
+        elif not self._app["image"].load_full():
+            raise NotTransformable(
+                "Image could not be loaded in full resolution to")
         # Some operations only make sense if we are allowed to save to file
         elif not settings["autosave_images"].get_value():
             message = ""